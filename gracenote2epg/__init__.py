@@ -9,22 +9,43 @@ __version__ = "1.5.5"
 __author__ = "th0ma7"
 __license__ = "GPL-3.0"
 
-from .gracenote2epg_args import ArgumentParser
-from .gracenote2epg_config import ConfigManager
-from .gracenote2epg_downloader import OptimizedDownloader
-from .gracenote2epg_language import LanguageDetector
-from .gracenote2epg_parser import GuideParser
-from .gracenote2epg_tvheadend import TvheadendClient
-from .gracenote2epg_utils import CacheManager, TimeUtils
-from .gracenote2epg_xmltv import XmltvGenerator
-from .gracenote2epg_dictionaries import (
-    get_category_translation,
-    get_term_translation,
-    get_language_display_name,
-    get_available_languages,
-    get_translation_statistics,
-    reload_translations,
-)
+import importlib
+
+# Public names and the submodule defining them: submodules (and their dependencies
+# such as requests) are only imported on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "ArgumentParser": "gracenote2epg_args",
+    "ConfigManager": "gracenote2epg_config",
+    "OptimizedDownloader": "gracenote2epg_downloader",
+    "LanguageDetector": "gracenote2epg_language",
+    "GuideParser": "gracenote2epg_parser",
+    "TvheadendClient": "gracenote2epg_tvheadend",
+    "CacheManager": "gracenote2epg_utils",
+    "TimeUtils": "gracenote2epg_utils",
+    "XmltvGenerator": "gracenote2epg_xmltv",
+    "get_category_translation": "gracenote2epg_dictionaries",
+    "get_term_translation": "gracenote2epg_dictionaries",
+    "get_language_display_name": "gracenote2epg_dictionaries",
+    "get_available_languages": "gracenote2epg_dictionaries",
+    "get_translation_statistics": "gracenote2epg_dictionaries",
+    "reload_translations": "gracenote2epg_dictionaries",
+}
+
+
+def __getattr__(name):
+    """Import the submodule defining a public name on first access"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    """Include the lazily imported public names"""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "ArgumentParser",
@@ -7,20 +7,41 @@ Provides baseline XMLTV grabber capabilities and lineup testing functionality.
 
 import argparse
 import logging
+import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+@lru_cache(maxsize=1)
+def _cached_home() -> Path:
+    """User home directory, resolved once per process"""
+    return Path.home()
+
+
+def _read_prefix(path: str, size: int = 8192) -> bytes:
+    """Read at most the first size bytes of a file (markers are near the top)"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
 class ArgumentParser:
     """Command line argument parser for gracenote2epg"""
 
     # Validation patterns
-    DAYS_PATTERN = re.compile(r"^[1-9]$|^1[0-4]$")  # 1-14 days
-    REFRESH_PATTERN = re.compile(r"^[0-9]+$|^[1-9][0-9]+$")  # 0-999 hours
-    CA_CODE_PATTERN = re.compile(r"^[A-Z][0-9][A-Z][ ]?[0-9][A-Z][0-9]$")  # Canadian postal
-    US_CODE_PATTERN = re.compile(r"^[0-9]{5}$")  # US ZIP code
+    RPI_CONTENT_PATTERN = re.compile(rb"raspberry|bcm2[78]")  # device-tree model / cpuinfo
+
+    # Raspberry Pi specific files (VideoCore tools, firmware boot config)
+    RPI_MARKERS = ("/opt/vc/bin/vcgencmd", "/boot/config.txt")
+
+    # Synology TVheadend package data directories
+    SYNOLOGY_DSM7_TVH_VAR = "/var/packages/tvheadend/var"
+    SYNOLOGY_DSM6_TVH_VAR = "/var/packages/tvheadend/target/var"
 
     def __init__(self):
         self.parser = self._create_parser()
@@ -250,27 +271,51 @@ LineupID Auto-Detection:
 
     def _validate_args(self, args):
         """Validate argument values"""
-        # Validate days parameter
-        if args.days is not None:
-            if not self.DAYS_PATTERN.match(str(args.days)):
-                self.parser.error(f"Parameter [--days] must be 1-14, got: {args.days}")
-
-        # Validate offset parameter
-        if args.offset is not None:
-            if not self.DAYS_PATTERN.match(str(args.offset)):
-                self.parser.error(f"Parameter [--offset] must be 1-14, got: {args.offset}")
-
-        # Validate refresh parameter
-        if args.refresh is not None:
-            if args.refresh < 0 or args.refresh > 168:  # 0 to 7 days
-                self.parser.error(f"Parameter [--refresh] must be 0-168 hours, got: {args.refresh}")
-
-        # Validate lineupid parameter (basic validation - more detailed validation in ConfigManager)
-        if args.lineupid is not None:
-            lineupid = args.lineupid.strip()
-            if not lineupid:
-                self.parser.error("Parameter [--lineupid] cannot be empty")
-            # Additional validation will be done in ConfigManager.normalize_lineup_id()
+        error = self._first_argument_error(args)
+        if error:
+            self.parser.error(error)
+
+    def _first_argument_error(self, args) -> Optional[str]:
+        """Return the error for the first invalid argument (None if all are valid)"""
+        validators = (
+            ("days", self._check_day_range),
+            ("offset", self._check_day_range),
+            ("refresh", self._check_refresh_range),
+            ("lineupid", self._check_lineupid),
+        )
+        for name, validator in validators:
+            value = getattr(args, name)
+            if value is not None:
+                error = validator(name, value)
+                if error:
+                    return error
+        return None
+
+    def _check_day_range(self, name: str, value: int) -> Optional[str]:
+        """Validate days/offset parameter (1-14)"""
+        if not 1 <= value <= 14:
+            return f"Parameter [--{name}] must be 1-14, got: {value}"
+        return None
+
+    def _check_refresh_range(self, name: str, value: int) -> Optional[str]:
+        """Validate refresh parameter (0 to 7 days)"""
+        if value < 0 or value > 168:
+            return f"Parameter [--{name}] must be 0-168 hours, got: {value}"
+        return None
+
+    def _check_lineupid(self, name: str, value: str) -> Optional[str]:
+        """Basic lineupid validation - more detailed validation in ConfigManager"""
+        if not value.strip():
+            return f"Parameter [--{name}] cannot be empty"
+        return None
+
+    @classmethod
+    def classify_location(cls, location_code: str) -> Optional[str]:
+        """Return 'ca' or 'us' for a location code (A1A 1A1 space allowed), None if invalid"""
+        from .gracenote2epg_config import ConfigManager
+
+        # Same validation as the configuration
+        return ConfigManager.classify_location(location_code)
 
     def _process_lineup_and_location(self, args):
         """Process lineup and location arguments with intelligent extraction and validation"""
@@ -284,15 +329,12 @@ LineupID Auto-Detection:
 
         # Case 1: Both lineupid (with location) and explicit location provided
         if extracted_location and location_code:
-            # Verify consistency
-            clean_extracted = extracted_location.replace(" ", "").upper()
+            # Verify consistency (extracted codes are already uppercase without spaces)
             clean_provided = location_code.replace(" ", "").upper()
 
-            if clean_extracted != clean_provided:
-                # Normalize display for error message (remove spaces)
-                normalized_extracted = extracted_location.replace(" ", "")
+            if extracted_location != clean_provided:
                 self.parser.error(
-                    f"Inconsistent location codes: lineupid contains '{normalized_extracted}' "
+                    f"Inconsistent location codes: lineupid contains '{extracted_location}' "
                     f"but explicit location is '{location_code}'. They must match."
                 )
 
@@ -304,7 +346,9 @@ LineupID Auto-Detection:
         elif extracted_location and not location_code:
             final_location = extracted_location
             args.location_source = "extracted"  # For logging purposes
-            logging.debug(f"Extracted location '{extracted_location}' from lineupid '{lineupid}'")
+            logging.debug(
+                "Extracted location '%s' from lineupid '%s'", extracted_location, lineupid
+            )
 
         # Case 3: Only explicit location provided (or lineupid without extractable location)
         elif location_code:
@@ -316,37 +360,23 @@ LineupID Auto-Detection:
             final_location = None
             args.location_source = None
 
-        # Validate the final location code if we have one
+        # Validate the final location code as given (only the A1A 1A1 space is allowed),
+        # then store it without spaces
         if final_location:
-            clean_code = final_location.replace(" ", "")
-            if not (
-                self.CA_CODE_PATTERN.match(final_location) or self.US_CODE_PATTERN.match(clean_code)
-            ):
-                source = (
-                    "lineupid" if extracted_location and not location_code else "explicit parameter"
-                )
-                # Normalize display for error message (remove spaces)
-                display_location = (
-                    final_location.replace(" ", "")
-                    if extracted_location and not location_code
-                    else final_location
-                )
+            if not self.classify_location(final_location):
+                from_lineupid = extracted_location and not location_code
+                source = "lineupid" if from_lineupid else "explicit parameter"
                 self.parser.error(
-                    f"Invalid location code from {source}: {display_location}. "
+                    f"Invalid location code from {source}: {final_location}. "
                     "Expected US ZIP (12345) or Canadian postal (A1A1A1)"
                 )
-
-        # Store the final result
-        if final_location:
             args.location_code = final_location.replace(" ", "")
         else:
             args.location_code = None
 
-        # Store original values for logging - normalize extracted_location display
+        # Store original values for logging
         args.original_lineupid = lineupid
-        args.extracted_location = (
-            extracted_location.replace(" ", "") if extracted_location else None
-        )
+        args.extracted_location = extracted_location
 
         # Clean up individual fields
         del args.zip, args.postal, args.code
@@ -359,31 +389,12 @@ LineupID Auto-Detection:
             lineupid: Lineup ID (e.g., 'CAN-OTAJ3B1M4', 'USA-OTA90210', 'CAN-0005993-X')
 
         Returns:
-            Extracted location code or None if not extractable
+            Extracted location code (uppercase, no spaces) or None if not extractable
         """
-        import re
-
-        # Pattern for OTA lineups: COUNTRY-OTA<LOCATION>[-DEFAULT]
-        # Examples: CAN-OTAJ3B1M4, USA-OTA90210, CAN-OTAJ3B1M4-DEFAULT
-        ota_pattern = re.compile(r"^(CAN|USA)-OTA([A-Z0-9]+)(?:-DEFAULT)?$", re.IGNORECASE)
-
-        match = ota_pattern.match(lineupid.strip())
-        if match:
-            country = match.group(1).upper()
-            location = match.group(2).upper()
-
-            # Validate extracted location format
-            if country == "CAN":
-                # Canadian postal: should be A1A1A1 format
-                if re.match(r"^[A-Z][0-9][A-Z][0-9][A-Z][0-9]$", location):
-                    # Format as A1A 1A1 (with space)
-                    return f"{location[:3]} {location[3:]}"
-            elif country == "USA":
-                # US ZIP: should be 5 digits
-                if re.match(r"^[0-9]{5}$", location):
-                    return location
+        from .gracenote2epg_config import ConfigManager
 
-        return None
+        # Same OTA parsing as the configuration
+        return ConfigManager.extract_location_from_lineupid(lineupid)
 
     def _normalize_langdetect(self, args):
         """Normalize langdetect option"""
@@ -428,9 +439,7 @@ LineupID Auto-Detection:
 
     def get_system_defaults(self):
         """Get system-specific default directories with proper DSM6/DSM7 path selection"""
-        from pathlib import Path
-
-        home = Path.home()
+        home = _cached_home()
 
         # Detect system type
         system_type = self._detect_system_type()
@@ -445,31 +454,40 @@ LineupID Auto-Detection:
 
         elif system_type == "synology":
             # Synology NAS with proper DSM6/DSM7 path selection
-            dsm_version = self._get_dsm_version()
+            dsm7_var = os.path.isdir(self.SYNOLOGY_DSM7_TVH_VAR)
+            dsm6_var = os.path.isdir(self.SYNOLOGY_DSM6_TVH_VAR)
+
+            if dsm7_var != dsm6_var:
+                # Only one package layout present: it tells the DSM generation
+                dsm_version = 50000 if dsm7_var else 30000
+            else:
+                # Both or neither present: ask /etc/VERSION
+                dsm_version = self._get_dsm_version()
 
             if dsm_version < 40000:
                 # DSM6 and earlier: /var/packages/tvheadend/target/var/epggrab/gracenote2epg
-                base_dir = Path("/var/packages/tvheadend/target/var/epggrab/gracenote2epg")
+                tvh_var = self.SYNOLOGY_DSM6_TVH_VAR
             else:
                 # DSM7 and later: /var/packages/tvheadend/var/epggrab/gracenote2epg
-                base_dir = Path("/var/packages/tvheadend/var/epggrab/gracenote2epg")
+                tvh_var = self.SYNOLOGY_DSM7_TVH_VAR
+            base_dir = Path(tvh_var, "epggrab", "gracenote2epg")
 
             # Add debug logging
-            import logging
-
-            logging.debug(f"Synology detected - DSM version: {dsm_version}")
-            logging.debug(f"Selected path: {base_dir}")
+            logging.debug("Synology detected - DSM version: %s", dsm_version)
+            logging.debug("Selected path: %s", base_dir)
 
             # Verify the parent directory exists, fallback if not
-            if not base_dir.parent.exists():
-                logging.warning(f"Expected Synology TVheadend path {base_dir.parent} doesn't exist")
+            if not os.path.isdir(os.path.join(tvh_var, "epggrab")):
+                logging.warning(
+                    "Expected Synology TVheadend path %s doesn't exist", base_dir.parent
+                )
                 logging.warning("Available TVheadend paths:")
-                for check_path in [
-                    "/var/packages/tvheadend/var",
-                    "/var/packages/tvheadend/target/var",
+                for check_path, found in [
+                    (self.SYNOLOGY_DSM7_TVH_VAR, dsm7_var),
+                    (self.SYNOLOGY_DSM6_TVH_VAR, dsm6_var),
                 ]:
-                    if Path(check_path).exists():
-                        logging.warning(f"  Found: {check_path}")
+                    if found:
+                        logging.warning("  Found: %s", check_path)
                         # Use the available path
                         base_dir = Path(check_path) / "epggrab" / "gracenote2epg"
                         break
@@ -491,9 +509,10 @@ LineupID Auto-Detection:
             "log_file": base_dir / "log" / "gracenote2epg.log",
         }
 
-    def create_directories_with_proper_permissions(self):
+    def create_directories_with_proper_permissions(self, defaults: Optional[dict] = None):
         """Create required directories with proper 755 permissions"""
-        defaults = self.get_system_defaults()
+        if defaults is None:
+            defaults = self.get_system_defaults()
 
         # Create directories with 755 permissions (rwxr-xr-x)
         for directory in [defaults["cache_dir"], defaults["conf_dir"], defaults["log_dir"]]:
@@ -505,55 +524,43 @@ LineupID Auto-Detection:
 
     def _detect_system_type(self):
         """Detect system type for default directories - FIXED for Synology"""
-        import platform
-
-        # Check if Raspberry Pi
-        device_tree_model = Path("/proc/device-tree/model")
-        if device_tree_model.exists():
-            try:
-                with open(device_tree_model) as f:
-                    if "raspberry" in f.read().lower():
+        # Check if Raspberry Pi - cheapest checks first (single stat per marker)
+        if any(os.path.lexists(marker) for marker in self.RPI_MARKERS):
+            return "raspberry"
+
+        for marker_file in ("/proc/device-tree/model", "/proc/cpuinfo"):
+            if os.path.exists(marker_file):
+                try:
+                    if self.RPI_CONTENT_PATTERN.search(_read_prefix(marker_file).lower()):
                         return "raspberry"
-            except Exception:
-                pass
-
-        cpuinfo = Path("/proc/cpuinfo")
-        if cpuinfo.exists():
-            try:
-                with open(cpuinfo) as f:
-                    if "raspberry" in f.read().lower():
-                        return "raspberry"
-            except Exception:
-                pass
+                except Exception:
+                    pass
 
         # FIXED: Enhanced Synology detection
 
         # Method 1: Check for Synology-specific files (most reliable)
-        if Path("/etc/synoinfo.conf").exists():
+        if os.path.exists("/etc/synoinfo.conf"):
             return "synology"
 
         # Method 2: Check VERSION file for Synology content
         try:
-            version_file = Path("/etc/VERSION")
-            if version_file.exists():
-                with open(version_file, "r") as f:
-                    content = f.read().lower()
-                    if "synology" in content or (
-                        "majorversion=" in content and "buildnumber=" in content
-                    ):
-                        return "synology"
+            if os.path.exists("/etc/VERSION"):
+                content = _read_prefix("/etc/VERSION").lower()
+                if b"synology" in content or (
+                    b"majorversion=" in content and b"buildnumber=" in content
+                ):
+                    return "synology"
         except Exception:
             pass
 
         # Method 3: Check for TVheadend Synology directory structure (DSM6 or DSM7)
-        if (
-            Path("/var/packages/tvheadend/var").exists()
-            or Path("/var/packages/tvheadend/target/var").exists()
-        ):
+        if os.path.exists(self.SYNOLOGY_DSM7_TVH_VAR) or os.path.exists(self.SYNOLOGY_DSM6_TVH_VAR):
             return "synology"
 
-        # Method 4: Original platform check (fallback)
+        # Method 4: Original platform check (fallback, platform only imported when needed)
         try:
+            import platform
+
             if "synology" in platform.uname().release.lower():
                 return "synology"
         except Exception:
@@ -567,9 +574,8 @@ LineupID Auto-Detection:
 
         # Method 1: Parse /etc/VERSION file (most accurate)
         try:
-            version_file = Path("/etc/VERSION")
-            if version_file.exists():
-                with open(version_file, "r") as f:
+            if os.path.exists("/etc/VERSION"):
+                with open("/etc/VERSION", "r") as f:
                     content = f.read()
 
                 # Extract major version and build number
@@ -598,16 +604,15 @@ LineupID Auto-Detection:
         # Method 2: Check directory structure as fallback to determine DSM version
         try:
             # DSM7+ path exists
-            if (
-                Path("/var/packages/tvheadend/var").exists()
-                and not Path("/var/packages/tvheadend/target/var").exists()
+            if os.path.exists(self.SYNOLOGY_DSM7_TVH_VAR) and not os.path.exists(
+                self.SYNOLOGY_DSM6_TVH_VAR
             ):
                 return 50000  # DSM7+
             # DSM6 path exists
-            elif Path("/var/packages/tvheadend/target/var").exists():
+            elif os.path.exists(self.SYNOLOGY_DSM6_TVH_VAR):
                 return 30000  # DSM6
             # Both exist (transition case) - prefer newer structure
-            elif Path("/var/packages/tvheadend/var").exists():
+            elif os.path.exists(self.SYNOLOGY_DSM7_TVH_VAR):
                 return 50000  # DSM7+
         except Exception:
             pass
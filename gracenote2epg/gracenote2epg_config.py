@@ -9,12 +9,114 @@ Updated with unified retention policies for logs and XMLTV backups.
 
 import logging
 import re
-import shutil
+import sys
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
+# Precompiled patterns (compiled once per process)
+_OTA_RE = re.compile(r"^(CAN|USA)-OTA([A-Z0-9]+)(?:-DEFAULT)?$", re.IGNORECASE)
+_DESC_RE = re.compile(r"desc[0-9]{2}")
+# Canadian postal (A1A1A1 or A1A 1A1) or US ZIP code (12345); ASCII only
+_LOCATION_RE = re.compile(r"(?P<ca>[A-Z][0-9][A-Z] ?[0-9][A-Z][0-9])|(?P<us>[0-9]{5})")
+
+# Sections of the cleaned configuration file, grouped with comments for readability
+_CONFIG_SECTIONS = (
+    ("Basic guide settings", ("zipcode", "lineupid", "days")),
+    ("Station filtering", ("slist", "stitle")),
+    ("Extended details and language detection", ("xdetails", "xdesc", "langdetect")),
+    ("Display options", ("epgenre", "epicon")),
+    (
+        "TVheadend integration",
+        ("tvhoff", "tvhurl", "tvhport", "tvhmatch", "chmatch", "usern", "passw"),
+    ),
+    ("Cache and retention policies", ("redays", "refresh", "logrotate", "relogs", "rexmltv")),
+)
+_SECTIONED_SETTINGS = frozenset(
+    setting_id for _, section_settings in _CONFIG_SECTIONS for setting_id in section_settings
+)
+
+# Setting line templates for the cleaned configuration file
+_SETTING_TPL = '  <setting id="{id}">{value}</setting>\n'
+_EMPTY_SETTING_TPL = '  <setting id="{id}"></setting>\n'
+
+
+# Gracenote grid API URL used by the lineup detection test
+_GRACENOTE_TEST_URL_TPL = (
+    "https://tvlistings.gracenote.com/api/grid?"
+    "aid=orbebb&"
+    "country={country}&"
+    "postalCode={zip}&"
+    "time={time}&"
+    "timespan=3&"
+    "isOverride=true&"
+    "userId=-&"
+    "lineupId={lineup}&"
+    "headendId=lineupId"
+)
+
+# Configuration values treated as boolean true
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
+
+# Accepted logrotate values and named retention periods
+_VALID_ROTATIONS = frozenset(("true", "false", "daily", "weekly", "monthly"))
+_VALID_RETENTION_PERIODS = frozenset(("weekly", "monthly", "quarterly", "unlimited"))
+
+# Retention period -> days (0 means unlimited), and default days per rotation interval
+_PERIOD_TO_DAYS = {"weekly": 7, "monthly": 30, "quarterly": 90, "unlimited": 0}
+_INTERVAL_DEFAULT_DAYS = {"daily": 30, "weekly": 90, "monthly": 365}
+
+# Days covered by one rotated file per rotation interval
+_INTERVAL_DAYS_PER_FILE = {"weekly": 7, "monthly": 30}
+
+# Device type and description template per lineup class (see _classify_lineup)
+_DEVICE_TYPE_BY_CLASS = {"OTA": "-", "CABLE": "X", "OTHER": "-"}
+_DESCRIPTION_TPL_BY_CLASS = {
+    "OTA": "Local Over the Air Broadcast ({})",
+    "CABLE": "Cable/Satellite Provider ({})",
+    "OTHER": "TV Lineup ({})",
+}
+
+
+@lru_cache(maxsize=1)
+def _langdetect_available() -> bool:
+    """Check once per process if langdetect is installed (without importing it)"""
+    import importlib.util
+
+    return importlib.util.find_spec("langdetect") is not None
+
+
+def _format_setting_line(setting_id: str, value: Any) -> str:
+    """Format one <setting> line, converting the value to text only once"""
+    text = "" if value is None else str(value)
+    if text.strip():
+        return _SETTING_TPL.format(id=setting_id, value=text)
+    return _EMPTY_SETTING_TPL.format(id=setting_id)
+
+
+def _classify_lineup(lineup_id: str) -> str:
+    """Classify a normalized lineup ID as OTA, CABLE or OTHER"""
+    if "OTA" in lineup_id:
+        return "OTA"
+    if lineup_id.endswith("-X"):
+        return "CABLE"
+    return "OTHER"
+
+
+def _parse_boolean(value: Any) -> bool:
+    """Parse boolean values from configuration"""
+    if isinstance(value, str):
+        return value.lower() in _TRUTHY
+    if value is None:
+        return False
+    return bool(value)
+
+
+def _str_or_empty(value: Any) -> Any:
+    """String settings: missing values become empty strings"""
+    return value if value is not None else ""
+
 
 class ConfigManager:
     """Manages gracenote2epg configuration file"""
@@ -56,6 +158,7 @@ class ConfigManager:
   <setting id="relogs">30</setting>
   <setting id="rexmltv">7</setting>
 </settings>"""
+    _DEFAULT_CONFIG_BYTES = DEFAULT_CONFIG.encode("utf-8")
 
     # Valid settings and their types
     VALID_SETTINGS = {
@@ -91,6 +194,15 @@ class ConfigManager:
         "rexmltv": str,
     }
 
+    # Per-setting (converter, type name), resolved once instead of per loaded setting
+    _CONVERTERS = {
+        setting_id: (
+            _parse_boolean if setting_type is bool else _str_or_empty,
+            setting_type.__name__,
+        )
+        for setting_id, setting_type in VALID_SETTINGS.items()
+    }
+
     # DEPRECATED settings for simplified removal (no migration)
     DEPRECATED_SETTINGS = {
         "auto_lineup": "lineupid",
@@ -107,6 +219,10 @@ class ConfigManager:
         "xmltv_backup_retention": "rexmltv",
     }
 
+    # Settings removed on cleanup: deprecated ones plus the old useragent setting
+    # (old descNN formatting settings are matched by pattern)
+    DEPRECATED_OR_LEGACY_SETTINGS = frozenset(DEPRECATED_SETTINGS) | {"useragent"}
+
     # Settings order for clean output
     SETTINGS_ORDER = [
         "zipcode",
@@ -132,6 +248,7 @@ class ConfigManager:
         "relogs",
         "rexmltv",
     ]
+    _SETTINGS_ORDER_INDEX = {setting_id: i for i, setting_id in enumerate(SETTINGS_ORDER)}
 
     def __init__(self, config_file: Path):
         self.config_file = Path(config_file)
@@ -141,6 +258,10 @@ class ConfigManager:
         self.config_changes: Dict[str, str] = {}  # Track command line changes for clean logging
         self._backup_file_created: Optional[str] = None  # Track backup file creation
         self._original_file_settings: Dict[str, Any] = {}  # Store original config file values
+        self._raw_original_settings: Dict[str, Optional[str]] = {}  # Unconverted file values
+        self._lineup_cache: Optional[Tuple[Tuple[str, str], Dict[str, Any]]] = None
+        self._extended_download: bool = False  # xdetails or xdesc, resolved at load
+        self._station_list: Optional[Tuple[str, ...]] = None  # slist, parsed at load
 
     def load_config(
         self,
@@ -244,66 +365,66 @@ class ConfigManager:
         # This uses the ORIGINAL file values, not the command line modified ones
         self._set_defaults()
 
+        # Settings are final (typed booleans): resolve derived flags once
+        self._extended_download = bool(
+            self.settings.get("xdetails", False) or self.settings.get("xdesc", False)
+        )
+        self._station_list = self._parse_station_list(self.settings.get("slist", ""))
+
         return self.settings
 
     def _validate_config_consistency(self):
         """Validate configuration consistency between zipcode and lineupid"""
-        zipcode = self.settings.get("zipcode", "").strip()
         lineupid = self.settings.get("lineupid", "auto").strip()
 
-        # If lineupid is not 'auto', check for consistency with zipcode
-        if lineupid.lower() != "auto":
-            extracted_location = self._extract_location_from_lineupid(lineupid)
-
-            if extracted_location and zipcode:
-                # Both zipcode in config and extractable location from lineupid
-                clean_extracted = extracted_location.replace(" ", "").upper()
-                clean_zipcode = zipcode.replace(" ", "").upper()
+        # Nothing to check with 'auto' (common case: skip the lowercase copy when exact)
+        if lineupid == "auto" or lineupid.lower() == "auto":
+            return
 
-                if clean_extracted != clean_zipcode:
-                    logging.error("Configuration mismatch detected:")
-                    logging.error("  Configured zipcode: %s", zipcode)
-                    # Normalize display (remove spaces)
-                    normalized_extracted = extracted_location.replace(" ", "")
-                    logging.error(
-                        "  LineupID contains: %s (extracted from %s)",
-                        normalized_extracted,
-                        lineupid,
-                    )
-                    logging.error("  These must match for consistent operation")
-                    raise ValueError(
-                        f'Configuration mismatch: zipcode "{zipcode}" conflicts with '
-                        f'lineupid "{lineupid}" (contains {normalized_extracted}). '
-                        "Either use auto-detection with zipcode or ensure consistency."
-                    )
-                else:
-                    logging.debug(
-                        'Configuration consistency verified: zipcode "%s" matches lineupid "%s"',
-                        zipcode,
-                        lineupid,
-                    )
-
-            elif extracted_location and not zipcode:
-                # Lineupid contains location but no zipcode configured - auto-extract
-                self.settings.get("zipcode", "").strip()
-                self.settings["zipcode"] = extracted_location.replace(" ", "")
-                self.zipcode_extracted_from_lineupid = True
-                # Normalize display (remove spaces)
-                normalized_extracted = extracted_location.replace(" ", "")
-                self.config_changes["zipcode"] = (
-                    f"(empty) → {normalized_extracted} (extracted from {lineupid})"
+        # Lineupid is explicit: check for consistency with zipcode
+        zipcode = self.settings.get("zipcode", "").strip()
+        extracted_location = self.extract_location_from_lineupid(lineupid)
+
+        if extracted_location and zipcode:
+            # Both zipcode in config and extractable location from lineupid
+            # (extracted location is already canonical: uppercase, no spaces)
+            if extracted_location != zipcode.replace(" ", "").upper():
+                logging.error("Configuration mismatch detected:")
+                logging.error("  Configured zipcode: %s", zipcode)
+                logging.error(
+                    "  LineupID contains: %s (extracted from %s)",
+                    extracted_location,
+                    lineupid,
                 )
-                # Normalize display (remove spaces)
-                logging.info(
-                    "Auto-extracted zipcode from lineupid: %s → %s", lineupid, normalized_extracted
+                logging.error("  These must match for consistent operation")
+                raise ValueError(
+                    f'Configuration mismatch: zipcode "{zipcode}" conflicts with '
+                    f'lineupid "{lineupid}" (contains {extracted_location}). '
+                    "Either use auto-detection with zipcode or ensure consistency."
+                )
+            else:
+                logging.debug(
+                    'Configuration consistency verified: zipcode "%s" matches lineupid "%s"',
+                    zipcode,
+                    lineupid,
                 )
 
-    def _extract_location_from_lineupid(self, lineupid: str) -> Optional[str]:
-        """Extract postal/ZIP code from lineup ID if it's in OTA format"""
-        # Pattern for OTA lineups: COUNTRY-OTA<LOCATION>[-DEFAULT]
-        ota_pattern = re.compile(r"^(CAN|USA)-OTA([A-Z0-9]+)(?:-DEFAULT)?$", re.IGNORECASE)
+        elif extracted_location and not zipcode:
+            # Lineupid contains location but no zipcode configured - auto-extract
+            self.settings["zipcode"] = extracted_location
+            self.zipcode_extracted_from_lineupid = True
+            self.config_changes["zipcode"] = (
+                f"(empty) → {extracted_location} (extracted from {lineupid})"
+            )
+            logging.info(
+                "Auto-extracted zipcode from lineupid: %s → %s", lineupid, extracted_location
+            )
 
-        match = ota_pattern.match(lineupid.strip())
+    @staticmethod
+    def extract_location_from_lineupid(lineupid: str) -> Optional[str]:
+        """Extract postal/ZIP code (uppercase, no spaces) from lineup ID if it's in OTA format"""
+        # Pattern for OTA lineups: COUNTRY-OTA<LOCATION>[-DEFAULT]
+        match = _OTA_RE.match(lineupid.strip())
         if match:
             country = match.group(1).upper()
             location = match.group(2).upper()
@@ -311,16 +432,21 @@ class ConfigManager:
             # Validate extracted location format
             if country == "CAN":
                 # Canadian postal: should be A1A1A1 format
-                if re.match(r"^[A-Z][0-9][A-Z][0-9][A-Z][0-9]$", location):
-                    # Format as A1A 1A1 (with space)
-                    return f"{location[:3]} {location[3:]}"
+                if ConfigManager.classify_location(location) == "ca":
+                    return location
             elif country == "USA":
                 # US ZIP: should be 5 digits
-                if re.match(r"^[0-9]{5}$", location):
+                if ConfigManager.classify_location(location) == "us":
                     return location
 
         return None
 
+    @staticmethod
+    def classify_location(location_code: str) -> Optional[str]:
+        """Return 'ca' or 'us' for an uppercase location code (A1A 1A1 space allowed), or None"""
+        match = _LOCATION_RE.fullmatch(location_code)
+        return match.lastgroup if match else None
+
     def _create_default_config(self):
         """Create default configuration file with proper permissions"""
         logging.info("Creating default configuration: %s", self.config_file)
@@ -333,21 +459,13 @@ class ConfigManager:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Write default configuration
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            f.write(self.DEFAULT_CONFIG)
+        self.config_file.write_bytes(self._DEFAULT_CONFIG_BYTES)
 
     def _parse_config_file(self):
         """Parse XML configuration file with simplified cleanup and automatic ordering"""
         try:
-            tree = ET.parse(self.config_file)
-            root = tree.getroot()
-
             logging.info("Reading configuration from: %s", self.config_file)
 
-            # Get version - default to version 5 for new unified format
-            self.version = root.attrib.get("version", "5")
-            logging.info("Configuration version: %s", self.version)
-
             # Parse settings with simplified validation
             valid_settings = {}
             deprecated_settings = []
@@ -357,44 +475,36 @@ class ConfigManager:
             # Track original order for comparison
             original_order = []
 
-            for setting in root.findall("setting"):
-                setting_id = setting.get("id")
-                original_order.append(setting_id)
+            # Bind loop invariants locally
+            valid_ids = self.VALID_SETTINGS
+            deprecated_ids = self.DEPRECATED_OR_LEGACY_SETTINGS
+            desc_match = _DESC_RE.match
+            add_order = original_order.append
 
-                # Get value based on version
-                if self.version == "2":
-                    setting_value = setting.text
-                else:
-                    # Version 3+: try 'value' attribute first, then text
-                    setting_value = setting.get("value")
-                    if setting_value is None:
-                        setting_value = setting.text
-                    if setting_value == "":
-                        setting_value = None
+            self.version, file_settings = self._read_settings()
+            logging.info("Configuration version: %s", self.version)
+
+            for setting_id, setting_value in file_settings:
+                add_order(setting_id)
 
                 logging.debug("Config setting: %s = %s", setting_id, setting_value)
 
                 # Categorize settings - SIMPLIFIED
-                if setting_id in self.VALID_SETTINGS:
+                if setting_id in valid_ids:
                     # Valid setting - keep as-is
                     valid_settings[setting_id] = setting_value
 
-                elif setting_id in self.DEPRECATED_SETTINGS:
-                    # Deprecated setting - mark for removal (no migration)
+                elif setting_id in deprecated_ids:
+                    # Deprecated or old useragent setting - mark for removal (no migration)
                     deprecated_settings.append(setting_id)
                     migration_needed = True
                     logging.debug("Deprecated setting found: %s (will be removed)", setting_id)
 
-                elif setting_id.startswith("desc") and re.match(r"desc[0-9]{2}", setting_id):
+                elif setting_id[:4] == "desc" and desc_match(setting_id):
                     # Old description formatting - mark for removal
                     deprecated_settings.append(setting_id)
                     migration_needed = True
 
-                elif setting_id == "useragent":
-                    # Old useragent setting - mark for removal
-                    deprecated_settings.append(setting_id)
-                    migration_needed = True
-
                 else:
                     # Unknown setting - mark for removal
                     unknown_settings.append(setting_id)
@@ -405,6 +515,9 @@ class ConfigManager:
                         setting_value,
                     )
 
+            # Keep the raw file values for later config file updates (avoids a re-parse)
+            self._raw_original_settings = dict(valid_settings)
+
             # Store valid settings in self.settings FIRST
             self._process_settings(valid_settings)
 
@@ -430,6 +543,39 @@ class ConfigManager:
             logging.error("Error reading configuration file %s: %s", self.config_file, e)
             raise
 
+    def _read_settings(self) -> Tuple[str, List[Tuple[Optional[str], Optional[str]]]]:
+        """Read the version and (id, value) pairs of top-level <setting> elements"""
+        # Get version - default to version 5 for new unified format
+        version = "5"
+        settings = []
+        depth = 0
+        for event, elem in ET.iterparse(str(self.config_file), events=("start", "end")):
+            if event == "start":
+                if depth == 0:
+                    version = elem.attrib.get("version", "5")
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth != 1 or elem.tag != "setting":
+                continue
+
+            # Get value based on version
+            if version == "2":
+                setting_value = elem.text
+            else:
+                # Version 3+: try 'value' attribute first, then text
+                setting_value = elem.get("value")
+                if setting_value is None:
+                    setting_value = elem.text
+                if setting_value == "":
+                    setting_value = None
+
+            settings.append((elem.get("id"), setting_value))
+            elem.clear()
+
+        return version, settings
+
     def _check_ordering_needed(
         self, original_order: List[str], valid_settings: Dict[str, str]
     ) -> bool:
@@ -440,15 +586,14 @@ class ConfigManager:
         ]
 
         # Get expected order for valid settings
-        expected_order = [
-            setting_id for setting_id in self.SETTINGS_ORDER if setting_id in valid_settings
-        ]
+        order_index = self._SETTINGS_ORDER_INDEX
+        expected_order = sorted(
+            (setting_id for setting_id in valid_settings if setting_id in order_index),
+            key=order_index.__getitem__,
+        )
 
         # Add any valid settings not in SETTINGS_ORDER (alphabetically)
-        remaining_settings = sorted(
-            [setting_id for setting_id in valid_settings if setting_id not in self.SETTINGS_ORDER]
-        )
-        expected_order.extend(remaining_settings)
+        expected_order.extend(sorted(valid_settings.keys() - order_index.keys()))
 
         # Compare orders
         if current_valid_order != expected_order:
@@ -461,33 +606,13 @@ class ConfigManager:
 
     def _process_settings(self, settings_dict: Dict[str, str]):
         """Process and type-convert settings"""
+        converters = self._CONVERTERS
         for setting_id, setting_value in settings_dict.items():
-            if setting_id in self.VALID_SETTINGS:
-                expected_type = self.VALID_SETTINGS[setting_id]
-
-                if expected_type == bool:
-                    self.settings[setting_id] = self._parse_boolean(setting_value)
-                elif expected_type == str:
-                    self.settings[setting_id] = setting_value if setting_value is not None else ""
-                else:
-                    self.settings[setting_id] = setting_value
-
-                logging.debug(
-                    "Processed setting: %s = %s (%s)",
-                    setting_id,
-                    self.settings[setting_id],
-                    expected_type.__name__,
-                )
-
-    def _parse_boolean(self, value: Any) -> bool:
-        """Parse boolean values from configuration"""
-        if value is None:
-            return False
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes", "on")
-        return bool(value)
+            converter = converters.get(setting_id)
+            if converter:
+                convert, type_name = converter
+                value = self.settings[setting_id] = convert(setting_value)
+                logging.debug("Processed setting: %s = %s (%s)", setting_id, value, type_name)
 
     def _validate_config(self):
         """Validate required configuration settings with enhanced error messages"""
@@ -501,12 +626,9 @@ class ConfigManager:
         # Enhanced validation for auto-detection lineup
         lineupid = self.settings.get("lineupid", "auto").strip().lower()
         if lineupid == "auto":
-            # Validate zipcode format for auto-detection
-            clean_code = zipcode.replace(" ", "")
-            is_valid_us = clean_code.isdigit() and len(clean_code) == 5
-            is_valid_ca = bool(re.match(r"^[A-Z][0-9][A-Z][0-9][A-Z][0-9]$", clean_code))
-
-            if not (is_valid_us or is_valid_ca):
+            # Validate zipcode format for auto-detection (US ZIP or Canadian postal)
+            clean_zipcode = zipcode.replace(" ", "")
+            if not self.classify_location(clean_zipcode):
                 logging.error("Auto-detection (lineupid=auto) requires a valid ZIP/postal code")
                 logging.error('Current zipcode: "%s"', zipcode)
                 logging.error("Expected formats:")
@@ -536,7 +658,7 @@ class ConfigManager:
     def _set_defaults(self):
         """Set default values for missing settings and update config file if needed"""
         # Check if langdetect is available for smart default
-        langdetect_available = self._check_langdetect_available()
+        langdetect_available = _langdetect_available()
 
         defaults = {
             "lineupid": "auto",  # Simplified single lineup setting
@@ -566,15 +688,20 @@ class ConfigManager:
         # Check what's missing from the ORIGINAL config file (not current self.settings)
         original_settings = getattr(self, "_original_file_settings", self.settings)
 
+        # Missing = absent (or None) in ORIGINAL file settings, found with one set difference
+        present = {key for key, value in original_settings.items() if value is not None}
+        missing = defaults.keys() - present
+        if not missing:
+            return
+
         added_defaults = []
         settings_to_add = {}
 
+        # Walk defaults (not the set) to keep a stable order in logs and the config file
         for key, default_value in defaults.items():
-            # Check if missing from ORIGINAL file settings
-            if key not in original_settings or original_settings[key] is None:
+            if key in missing:
                 # Add to current settings for this execution
-                if key not in self.settings:
-                    self.settings[key] = default_value
+                self.settings.setdefault(key, default_value)
 
                 # Track for file update
                 settings_to_add[key] = default_value
@@ -594,28 +721,9 @@ class ConfigManager:
     def _update_config_with_missing_defaults(self, new_settings: Dict[str, Any]):
         """Update the configuration file to include ONLY newly added default settings"""
         try:
-            # Re-read the original config file to get the unmodified values
-            tree = ET.parse(self.config_file)
-            root = tree.getroot()
-
-            # Get existing settings to preserve their ORIGINAL values (not from self.settings)
-            existing_settings = {}
-            for setting in root.findall("setting"):
-                setting_id = setting.get("id")
-
-                # Get value based on version (same logic as in _parse_config_file)
-                if self.version == "2":
-                    setting_value = setting.text
-                else:
-                    setting_value = setting.get("value")
-                    if setting_value is None:
-                        setting_value = setting.text
-                    if setting_value == "":
-                        setting_value = None
-
-                # Only include valid settings that we want to preserve
-                if setting_id in self.VALID_SETTINGS:
-                    existing_settings[setting_id] = setting_value
+            # Existing settings keep their ORIGINAL file values (not from self.settings),
+            # as captured by _parse_config_file
+            existing_settings = dict(self._raw_original_settings)
 
             # Add only the truly new settings (those not in original file)
             for key, value in new_settings.items():
@@ -654,13 +762,6 @@ class ConfigManager:
         logging.warning("Documentation: https://github.com/th0ma7/gracenote2epg")
         logging.warning("=" * 60)
 
-    def _check_langdetect_available(self) -> bool:
-        """Check if langdetect library is available"""
-        try:
-            return True
-        except ImportError:
-            return False
-
     def _clean_and_migrate_config(
         self,
         valid_settings: Dict[str, str],
@@ -671,6 +772,10 @@ class ConfigManager:
         try:
             # Create backup only if we're making changes
             if removed_settings or ordering_needed:
+                # Rarely needed: import backup helpers only here
+                import shutil
+                from datetime import datetime
+
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_file = f"{self.config_file}.backup.{timestamp}"
                 shutil.copy2(self.config_file, backup_file)
@@ -716,67 +821,41 @@ class ConfigManager:
 
     def _write_clean_config(self, valid_settings: Dict[str, str]):
         """Write configuration file in proper order with nice formatting"""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            f.write('<?xml version="1.0" encoding="utf-8"?>\n')
-            f.write('<settings version="5">\n')
-
-            # Group settings with comments for better readability
-            sections = [
-                ("Basic guide settings", ["zipcode", "lineupid", "days"]),
-                ("Station filtering", ["slist", "stitle"]),
-                ("Extended details and language detection", ["xdetails", "xdesc", "langdetect"]),
-                ("Display options", ["epgenre", "epicon"]),
-                (
-                    "TVheadend integration",
-                    ["tvhoff", "tvhurl", "tvhport", "tvhmatch", "chmatch", "usern", "passw"],
-                ),
-                (
-                    "Cache and retention policies",
-                    ["redays", "refresh", "logrotate", "relogs", "rexmltv"],
-                ),
-            ]
-
-            written_settings = set()
-
-            for section_name, section_settings in sections:
-                # Check if this section has any settings to write
-                has_settings = any(setting_id in valid_settings for setting_id in section_settings)
-
-                if has_settings:
-                    f.write(f"\n  <!-- {section_name} -->\n")
-
-                    for setting_id in section_settings:
-                        if setting_id in valid_settings:
-                            value = valid_settings[setting_id]
-                            if value is not None and str(value).strip():
-                                f.write(f'  <setting id="{setting_id}">{value}</setting>\n')
-                            else:
-                                f.write(f'  <setting id="{setting_id}"></setting>\n')
-                            written_settings.add(setting_id)
-
-            # Write any remaining settings not in predefined sections (alphabetically)
-            remaining_settings = sorted(
-                [setting_id for setting_id in valid_settings if setting_id not in written_settings]
-            )
+        # Serialize everything in memory first, then encode and write it with a single call
+        parts = ['<?xml version="1.0" encoding="utf-8"?>\n<settings version="5">\n']
+
+        for section_name, section_settings in _CONFIG_SECTIONS:
+            # Check if this section has any settings to write
+            has_settings = any(setting_id in valid_settings for setting_id in section_settings)
+
+            if has_settings:
+                parts.append(f"\n  <!-- {section_name} -->\n")
+
+                for setting_id in section_settings:
+                    if setting_id in valid_settings:
+                        parts.append(_format_setting_line(setting_id, valid_settings[setting_id]))
+
+        # Write any remaining settings not in predefined sections (alphabetically)
+        extra_settings = valid_settings.keys() - _SECTIONED_SETTINGS
 
-            if remaining_settings:
-                f.write("\n  <!-- Other settings -->\n")
-                for setting_id in remaining_settings:
-                    value = valid_settings[setting_id]
-                    if value is not None and str(value).strip():
-                        f.write(f'  <setting id="{setting_id}">{value}</setting>\n')
-                    else:
-                        f.write(f'  <setting id="{setting_id}"></setting>\n')
+        if extra_settings:
+            parts.append("\n  <!-- Other settings -->\n")
+            for setting_id in sorted(extra_settings):
+                parts.append(_format_setting_line(setting_id, valid_settings[setting_id]))
 
-            f.write("</settings>\n")
+        parts.append("</settings>\n")
+
+        # Rewrite in place (a backup was taken first): keeps symlinks, bind-mounted
+        # files, ownership and permissions intact
+        with open(self.config_file, "wb") as f:
+            f.write("".join(parts).encode("utf-8"))
 
     def _validate_cache_and_retention_policies(self):
         """Validate unified cache and retention policy configuration settings"""
         # Validate logrotate
         logrotate = self.settings.get("logrotate", "true").lower().strip()
-        valid_rotations = ["true", "false", "daily", "weekly", "monthly"]
 
-        if logrotate not in valid_rotations:
+        if logrotate not in _VALID_ROTATIONS:
             logging.warning('Invalid logrotate value "%s", using default "true"', logrotate)
             self.settings["logrotate"] = "true"
         else:
@@ -794,29 +873,36 @@ class ConfigManager:
             logging.warning('Invalid rexmltv value "%s", using default "7"', rexmltv)
             self.settings["rexmltv"] = "7"
 
-        # Validate redays >= days
+        # Validate redays >= days (days is parsed only once)
         try:
             days = int(self.settings.get("days", "1"))
-            redays = int(self.settings.get("redays", str(days)))
-
-            if redays < days:
-                logging.warning(
-                    "redays (%d) must be >= days (%d), adjusting redays to %d", redays, days, days
-                )
-                self.settings["redays"] = str(days)
-            # Remove the excessive warning - just log at debug level
-            elif redays > days * 3:  # Reasonable upper limit
-                logging.debug(
-                    "redays (%d) is much higher than days (%d) - see documentation for optimization tips",
-                    redays,
-                    days,
-                )
+        except (ValueError, TypeError):
+            logging.error('Invalid days value "%s"', self.settings.get("days"))
+            raise ValueError(
+                f'Invalid days value "{self.settings.get("days")}" in configuration. '
+                "Expected a number of days (1-14)"
+            )
 
+        try:
+            redays = int(self.settings.get("redays", days))
         except (ValueError, TypeError):
             # Set redays to match days if invalid
-            days = int(self.settings.get("days", "1"))
             self.settings["redays"] = str(days)
             logging.warning("Invalid redays value, setting to match days (%d)", days)
+            return
+
+        if redays < days:
+            logging.warning(
+                "redays (%d) must be >= days (%d), adjusting redays to %d", redays, days, days
+            )
+            self.settings["redays"] = str(days)
+        # Remove the excessive warning - just log at debug level
+        elif redays > days * 3:  # Reasonable upper limit
+            logging.debug(
+                "redays (%d) is much higher than days (%d) - see documentation for optimization tips",
+                redays,
+                days,
+            )
 
     def _validate_retention_value(self, value: str) -> bool:
         """Validate retention value: must be number (days) or weekly/monthly/quarterly/unlimited"""
@@ -831,8 +917,7 @@ class ConfigManager:
             pass
 
         # Check if it's a valid period
-        valid_periods = ["weekly", "monthly", "quarterly", "unlimited"]
-        return value.lower() in valid_periods
+        return value.lower() in _VALID_RETENTION_PERIODS
 
     def display_lineup_detection_test(self, postal_code: str, debug_mode: bool = False) -> bool:
         """
@@ -898,143 +983,159 @@ class ConfigManager:
         standard_dt = now.replace(hour=standard_hour)
         example_time = str(int(time.mktime(standard_dt.timetuple())))
 
+        # Collect the whole report, then write it in one go
+        out: List[str] = []
+
         # Header (different for debug mode)
         if debug_mode:
-            print("=" * 70)
-            print("GRACENOTE2EPG - LINEUP DETECTION (DEBUG MODE)")
-            print("=" * 70)
-            print(f"📍 LOCATION INFORMATION:")
-            print(f"   Normalized code:   {clean_postal}")
-            print(f"   Detected country:  {country_name} ({country})")
-            print()
+            out.append("=" * 70)
+            out.append("GRACENOTE2EPG - LINEUP DETECTION (DEBUG MODE)")
+            out.append("=" * 70)
+            out.append(f"📍 LOCATION INFORMATION:")
+            out.append(f"   Normalized code:   {clean_postal}")
+            out.append(f"   Detected country:  {country_name} ({country})")
+            out.append("")
 
         # API parameters
-        print(f"🌍 GRACENOTE API URL PARAMETERS:")
-        print(f"   lineupId={lineup_config['api_lineup_id']}")
-        print(f"   country={country}")
-        print(f"   postalCode={clean_postal}")
-        print()
+        out.append(f"🌍 GRACENOTE API URL PARAMETERS:")
+        out.append(f"   lineupId={lineup_config['api_lineup_id']}")
+        out.append(f"   country={country}")
+        out.append(f"   postalCode={clean_postal}")
+        out.append("")
 
         # Validation URLs
-        print(f"✅ VALIDATION URLs (manual verification):")
-        print(f"   Auto-generated: {lineup_config['tvtv_url']}")
+        out.append(f"✅ VALIDATION URLs (manual verification):")
+        out.append(f"   Auto-generated: {lineup_config['tvtv_url']}")
 
         if debug_mode:
-            print(
+            out.append(
                 f"   Note: OTA format is {lineup_config['tvtv_lineup_id']} "
                 f"(country + OTA + postal, no -DEFAULT suffix)"
             )
-            print(f"   Cable/Satellite providers use different format: {country}-[ProviderID]-X")
-
-        print(f"   Manual lookup:")
-        if country == "CAN":
-            print(f"     1. Go to https://www.tvtv.ca/")
-            print(f"     2. Enter postal code: {clean_postal}")
-            print(
-                f"     3a. For OTA: Click 'Broadcast' → 'Local Over the Air' → "
-                f"URL shows lu{lineup_config['tvtv_lineup_id']}"
+            out.append(
+                f"   Cable/Satellite providers use different format: {country}-[ProviderID]-X"
             )
-            print(f"     3b. For Cable/Sat: Select provider → URL shows lu{country}-[ProviderID]-X")
-        else:
-            print(f"     1. Go to https://www.tvtv.us/")
-            print(f"     2. Enter ZIP code: {clean_postal}")
-            print(
-                f"     3a. For OTA: Click 'Broadcast' → 'Local Over the Air' → "
-                f"URL shows lu{lineup_config['tvtv_lineup_id']}"
-            )
-            print(f"     3b. For Cable/Sat: Select provider → URL shows lu{country}-[ProviderID]-X")
-        print()
+
+        self._append_manual_lookup(out, country, clean_postal, lineup_config["tvtv_lineup_id"])
+        out.append("")
 
         # API test URL
-        print(f"🔗 GRACENOTE API URL FOR TESTING:")
+        out.append(f"🔗 GRACENOTE API URL FOR TESTING:")
 
         if debug_mode:
             # Show the human-readable time for debugging
-            print(f"   Using current block: {standard_dt.strftime('%Y-%m-%d %H:00')} "
-                  f"(timestamp: {example_time})")
-
-        test_url = (
-            f"https://tvlistings.gracenote.com/api/grid?"
-            f"aid=orbebb&"
-            f"country={country}&"
-            f"postalCode={clean_postal}&"
-            f"time={example_time}&"
-            f"timespan=3&"
-            f"isOverride=true&"
-            f"userId=-&"
-            f"lineupId={lineup_config['api_lineup_id']}&"
-            f"headendId=lineupId"
+            out.append(
+                f"   Using current block: {standard_dt.strftime('%Y-%m-%d %H:00')} "
+                f"(timestamp: {example_time})"
+            )
+
+        test_url = _GRACENOTE_TEST_URL_TPL.format(
+            country=country,
+            zip=clean_postal,
+            time=example_time,
+            lineup=lineup_config["api_lineup_id"],
         )
-        print(f"   {test_url}")
-        print()
+        out.append(f"   {test_url}")
+        out.append("")
 
         # Debug-only sections
         if debug_mode:
-            print(f"📊 GRACENOTE API - OTHER COMMON PARAMETERS:")
-            print(
+            out.append(f"📊 GRACENOTE API - OTHER COMMON PARAMETERS:")
+            out.append(
                 f"   • &device=[-|X]                    "
                 f"Device type: - for Over-the-Air, X for cable/satellite"
             )
-            print(
+            out.append(
                 f"   • &pref=16%2C128                   "
                 f"Preference codes (16,128): channel lineup preferences"
             )
-            print(
+            out.append(
                 f"   • &timezone=America%2FNew_York     "
                 f"User timezone for schedule times (URL-encoded)"
             )
-            print(f"   • &languagecode=en-us              Content language: en-us, fr-ca, es-us, etc.")
-            print(
+            out.append(
+                f"   • &languagecode=en-us              Content language: en-us, fr-ca, es-us, etc."
+            )
+            out.append(
                 f"   • &TMSID=                          "
                 f"Tribune Media Services ID (legacy, usually empty)"
             )
-            print(
+            out.append(
                 f"   • &AffiliateID=lat                 "
                 f"Partner/affiliate identifier (lat=local affiliate)"
             )
-            print()
+            out.append("")
 
-            print(f"💾 MANUAL DOWNLOAD:")
-            print(f"⚠️  NOTE: Using browser-like headers to bypass AWS WAF")
-            print()
-            print(
+            out.append(f"💾 MANUAL DOWNLOAD:")
+            out.append(f"⚠️  NOTE: Using browser-like headers to bypass AWS WAF")
+            out.append("")
+            out.append(
                 f'curl -s -H "User-Agent: Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
                 f'AppleWebKit/537.36" \\'
             )
-            print(f'     -H "Accept: application/json, text/html, application/xhtml+xml, */*" \\')
-            print(f'     "{test_url}" > out.json')
-            print()
+            out.append(
+                f'     -H "Accept: application/json, text/html, application/xhtml+xml, */*" \\'
+            )
+            out.append(f'     "{test_url}" > out.json')
+            out.append("")
 
-            print(f"🔧 RECOMMENDED CONFIGURATION:")
+            out.append(f"🔧 RECOMMENDED CONFIGURATION:")
             country_full = "Canada" if country == "CAN" else "United States"
-            print(f"   <!-- Simplified configuration (auto-detection) -->")
-            print(f'   <setting id="zipcode">{clean_postal}</setting>')
-            print(f'   <setting id="lineupid">auto</setting>')
-            print()
-            print(f"   <!-- Alternative: Copy tvtv.com lineup ID directly -->")
-            print(f"   <!-- <setting id=\"lineupid\">{lineup_config['tvtv_lineup_id']}</setting> -->")
-            print()
-            print(f"   <!-- For Cable/Satellite providers: -->")
-            print(f'   <!-- <setting id="lineupid">{country}-[ProviderID]-X</setting> -->')
-            print(
+            out.append(f"   <!-- Simplified configuration (auto-detection) -->")
+            out.append(f'   <setting id="zipcode">{clean_postal}</setting>')
+            out.append(f'   <setting id="lineupid">auto</setting>')
+            out.append("")
+            out.append(f"   <!-- Alternative: Copy tvtv.com lineup ID directly -->")
+            out.append(
+                f"   <!-- <setting id=\"lineupid\">{lineup_config['tvtv_lineup_id']}</setting> -->"
+            )
+            out.append("")
+            out.append(f"   <!-- For Cable/Satellite providers: -->")
+            out.append(f'   <!-- <setting id="lineupid">{country}-[ProviderID]-X</setting> -->')
+            out.append(
                 f'   <!-- Example: <setting id="lineupid">{country}-0005993-X</setting> '
                 f'for Videotron -->'
             )
-            print()
-
-            print("=" * 70)
-            print("💡 NEXT STEPS:")
-            print("1. Verify the validation URLs show your local channels")
-            print("2. Update your gracenote2epg.xml with the recommended configuration")
-            print("3. Run: tv_grab_gracenote2epg --days 1 --console")
-            print("4. Look for 'Auto-detected lineupID' in the logs")
-            print("5. Confirm no HTTP 400 errors in download attempts")
-            print("=" * 70)
-            print()
+            out.append("")
+
+            out.append("=" * 70)
+            out.append("💡 NEXT STEPS:")
+            out.append("1. Verify the validation URLs show your local channels")
+            out.append("2. Update your gracenote2epg.xml with the recommended configuration")
+            out.append("3. Run: tv_grab_gracenote2epg --days 1 --console")
+            out.append("4. Look for 'Auto-detected lineupID' in the logs")
+            out.append("5. Confirm no HTTP 400 errors in download attempts")
+            out.append("=" * 70)
+            out.append("")
 
         # Documentation link (always shown)
-        print("📖 DOCUMENTATION:")
-        print("   https://github.com/th0ma7/gracenote2epg/blob/main/docs/lineup-configuration.md")
+        out.append("📖 DOCUMENTATION:")
+        out.append(
+            "   https://github.com/th0ma7/gracenote2epg/blob/main/docs/lineup-configuration.md"
+        )
+
+        sys.stdout.write("\n".join(out))
+        sys.stdout.write("\n")
+
+    def _append_manual_lookup(
+        self, out: List[str], country: str, clean_postal: str, tvtv_lineup_id: str
+    ):
+        """Append the tvtv.com manual lookup steps for the given country"""
+        if country == "CAN":
+            site, code_label = "https://www.tvtv.ca/", "postal code"
+        else:
+            site, code_label = "https://www.tvtv.us/", "ZIP code"
+
+        out.append("   Manual lookup:")
+        out.append(f"     1. Go to {site}")
+        out.append(f"     2. Enter {code_label}: {clean_postal}")
+        out.append(
+            "     3a. For OTA: Click 'Broadcast' → 'Local Over the Air' → "
+            f"URL shows lu{tvtv_lineup_id}"
+        )
+        out.append(
+            f"     3b. For Cable/Sat: Select provider → URL shows lu{country}-[ProviderID]-X"
+        )
 
     def validate_postal_code_format(self, postal_code: str) -> Tuple[bool, str, str]:
         """
@@ -1048,9 +1149,10 @@ class ConfigManager:
         """
         clean_postal = postal_code.replace(" ", "").upper()
 
-        if clean_postal.isdigit() and len(clean_postal) == 5:
+        location_type = self.classify_location(clean_postal)
+        if location_type == "us":
             return True, "USA", clean_postal
-        elif re.match(r"^[A-Z][0-9][A-Z][0-9][A-Z][0-9]$", clean_postal):
+        elif location_type == "ca":
             return True, "CAN", clean_postal
         else:
             return False, "", clean_postal
@@ -1089,12 +1191,8 @@ class ConfigManager:
         Returns:
             Device type: "-" for OTA, "X" for cable/satellite
         """
-        if "OTA" in normalized_lineup_id:
-            return "-"  # Over-the-Air
-        elif normalized_lineup_id.endswith("-X"):
-            return "X"  # Cable/Satellite
-        else:
-            return "-"  # Default to OTA
+        # Over-the-Air and unknown lineups default to "-", cable/satellite is "X"
+        return _DEVICE_TYPE_BY_CLASS[_classify_lineup(normalized_lineup_id)]
 
     def generate_description(self, normalized_lineup_id: str, country: str) -> str:
         """
@@ -1108,33 +1206,35 @@ class ConfigManager:
             Human-readable description
         """
         country_name = "United States" if country == "USA" else "Canada"
-
-        if "OTA" in normalized_lineup_id:
-            return f"Local Over the Air Broadcast ({country_name})"
-        elif normalized_lineup_id.endswith("-X"):
-            return f"Cable/Satellite Provider ({country_name})"
-        else:
-            return f"TV Lineup ({country_name})"
+        return _DESCRIPTION_TPL_BY_CLASS[_classify_lineup(normalized_lineup_id)].format(
+            country_name
+        )
 
     def get_lineup_config(self) -> Dict[str, str]:
         """Get lineup configuration with automatic normalization and detection"""
         lineupid = self.settings.get("lineupid", "auto")
         postal_code = self.settings.get("zipcode", "")
+
+        # Memoized on the two settings it derives from
+        cache_key = (lineupid, postal_code)
+        if self._lineup_cache is not None and self._lineup_cache[0] == cache_key:
+            return dict(self._lineup_cache[1])
+
         country = self.get_country()
 
         # Normalize lineup ID
         normalized_lineup_id = self.normalize_lineup_id(lineupid, country, postal_code)
 
-        # Auto-detect device type
-        device_type = self.detect_device_type(normalized_lineup_id)
-
-        # Auto-generate description
-        description = self.generate_description(normalized_lineup_id, country)
+        # Classify once, then auto-detect device type and auto-generate description
+        lineup_class = _classify_lineup(normalized_lineup_id)
+        device_type = _DEVICE_TYPE_BY_CLASS[lineup_class]
+        country_name = "United States" if country == "USA" else "Canada"
+        description = _DESCRIPTION_TPL_BY_CLASS[lineup_class].format(country_name)
 
         # Determine if this was auto-detected
         auto_detected = not lineupid or lineupid.lower() == "auto"
 
-        return {
+        lineup_config = {
             "lineup_id": normalized_lineup_id,  # Full API format
             "headend_id": "lineupId",  # Always literal 'lineupId' for API
             "device_type": device_type,  # Auto-detected device type
@@ -1144,6 +1244,8 @@ class ConfigManager:
             "country": country,
             "postal_code": postal_code,
         }
+        self._lineup_cache = (cache_key, lineup_config)
+        return dict(lineup_config)
 
     def _get_auto_lineup_config(self, postal_code: str, country: str) -> Dict[str, str]:
         """Get auto-generated lineup configuration for display purposes"""
@@ -1220,73 +1322,66 @@ class ConfigManager:
         except ValueError:
             pass
 
-        # Handle period-based retention
-        if retention_value == "weekly":
-            return 7
-        elif retention_value == "monthly":
-            return 30
-        elif retention_value == "quarterly":
-            return 90
-        elif retention_value == "unlimited":
-            return 0  # 0 means unlimited
-        else:
-            # Default based on interval
-            if interval == "daily":
-                return 30
-            elif interval == "weekly":
-                return 90  # ~3 months
-            elif interval == "monthly":
-                return 365  # 1 year
-            else:
-                return 30
+        # Handle period-based retention, else default based on interval
+        days = _PERIOD_TO_DAYS.get(retention_value)
+        if days is not None:
+            return days
+        return _INTERVAL_DEFAULT_DAYS.get(interval, 30)
 
     def _days_to_keep_files(self, retention_days: int, interval: str) -> int:
         """Convert retention days to number of backup files to keep"""
         if retention_days == 0:
             return 0  # Unlimited
 
-        if interval == "daily":
-            return retention_days
-        elif interval == "weekly":
-            return max(1, retention_days // 7)
-        elif interval == "monthly":
-            return max(1, retention_days // 30)
-        else:
-            return retention_days
+        days_per_file = _INTERVAL_DAYS_PER_FILE.get(interval)
+        if days_per_file is None:
+            return retention_days  # daily (one file per day)
+        return max(1, retention_days // days_per_file)
 
     def get_country(self) -> str:
         """Determine country from zipcode format"""
         zipcode = self.settings.get("zipcode", "")
-        if zipcode.isdigit():
+        if self.classify_location(zipcode.replace(" ", "")) == "us":
             return "USA"
         else:
             return "CAN"
 
     def needs_extended_download(self) -> bool:
         """Determine if extended details download is needed"""
-        return self.settings.get("xdetails", False) or self.settings.get("xdesc", False)
+        return self._extended_download
 
     def get_station_list(self) -> Optional[List[str]]:
-        """Get explicit station list if configured"""
-        slist = self.settings.get("slist", "")
-        if slist and slist.strip():
-            return [s.strip() for s in slist.split(",") if s.strip()]
-        return None
+        """Get explicit station list if configured (parsed once at load, returned as a new list)"""
+        return list(self._station_list) if self._station_list else None
+
+    @staticmethod
+    def _parse_station_list(slist: str) -> Optional[Tuple[str, ...]]:
+        """Split the comma-separated slist setting into station IDs (None if empty)"""
+        if not slist:
+            return None
+        stations = tuple(station for station in map(str.strip, slist.split(",")) if station)
+        return stations or None
+
+    def _iget(self, key: str, default: int) -> int:
+        """Get an integer setting, falling back to the default if invalid"""
+        raw = self.settings.get(key, default)
+        try:
+            return int(raw)
+        except (ValueError, TypeError):
+            logging.warning('Invalid %s setting "%s", using default %d', key, raw, default)
+            return default
 
     def get_refresh_hours(self) -> int:
         """Get cache refresh hours from configuration"""
-        try:
-            return int(self.settings.get("refresh", "48"))
-        except (ValueError, TypeError):
-            logging.warning("Invalid refresh setting, using default 48 hours")
-            return 48
+        return self._iget("refresh", 48)
 
     def log_config_summary(self):
         """Log configuration summary with improved clarity"""
+        get = self.settings.get
         logging.info("Configuration values processed:")
 
         # Enhanced zipcode logging with cleaner format
-        zipcode = self.settings.get("zipcode")
+        zipcode = get("zipcode")
         if "zipcode" in getattr(self, "config_changes", {}):
             change_info = self.config_changes["zipcode"]
             logging.info("  zipcode: %s", change_info)
@@ -1320,15 +1415,17 @@ class ConfigManager:
 
         logging.info("  description: %s", lineup_config["description"])
 
-        logging.info("  xdetails (download extended data): %s", self.settings.get("xdetails"))
-        logging.info("  xdesc (use extended descriptions): %s", self.settings.get("xdesc"))
-        logging.info(
-            "  langdetect (automatic language detection): %s", self.settings.get("langdetect")
-        )
+        xdetails = get("xdetails", False)
+        xdesc = get("xdesc", False)
+        langdetect = get("langdetect", False)
+
+        logging.info("  xdetails (download extended data): %s", xdetails)
+        logging.info("  xdesc (use extended descriptions): %s", xdesc)
+        logging.info("  langdetect (automatic language detection): %s", langdetect)
 
         # Log cache and retention configuration
         refresh_hours = self.get_refresh_hours()
-        redays = int(self.settings.get("redays", "1"))
+        redays = self._iget("redays", 1)
 
         logging.info("Cache and retention policies:")
         if refresh_hours == 0:
@@ -1358,10 +1455,6 @@ class ConfigManager:
         )
 
         # Log configuration logic
-        xdetails = self.settings.get("xdetails", False)
-        xdesc = self.settings.get("xdesc", False)
-        langdetect = self.settings.get("langdetect", False)
-
         if xdesc and not xdetails:
             logging.info("xdesc=true detected - automatically enabling extended details download")
         elif xdetails and not xdesc:
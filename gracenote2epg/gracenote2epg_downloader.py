@@ -8,10 +8,8 @@ and intelligent retry logic for both guide data and extended series details.
 import json
 import logging
 import random
+import threading
 import time
-import urllib.request
-import urllib.error
-import urllib.parse
 from typing import Optional, Dict, Any
 
 import requests
@@ -19,12 +17,15 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import urllib3
 
+from .gracenote2epg_utils import json_loads
+
 
 class OptimizedDownloader:
     """Optimized download manager with WAF protection and adaptive delays"""
 
     def __init__(self, base_delay: float = 1.0, min_delay: float = 0.5):
         self.session: Optional[requests.Session] = None
+        self.details_session: Optional[requests.Session] = None
         self.user_agents = [
             "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/115.0",
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -40,6 +41,7 @@ class OptimizedDownloader:
         self.waf_blocks = 0
         self.total_requests = 0
         self.current_ua_index = 0
+        self.cancelled = threading.Event()  # Set on interrupted runs: stop delays and retries
 
         # Initialize session
         self.init_session()
@@ -87,6 +89,27 @@ class OptimizedDownloader:
         logging.info("Optimized session initialized with persistent connections")
         logging.debug("  Connection pooling: 1 connection max, keep-alive enabled")
 
+    def get_details_session(self) -> requests.Session:
+        """Get the keep-alive session used for series details (created on first use)"""
+        if self.details_session is None:
+            # Single persistent connection: keeps the sequential request pattern, but
+            # reuses the TCP/TLS connection instead of a new handshake per series.
+            # Like urlopen, it honors proxy environment variables and follows redirects.
+            self.details_session = requests.Session()
+
+            # No default headers: send the same minimal request as the urllib version
+            self.details_session.headers.clear()
+
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=1,
+                max_retries=Retry(total=0, backoff_factor=0, status_forcelist=[]),
+                pool_block=True,
+            )
+            self.details_session.mount("https://", adapter)
+            self.details_session.mount("http://", adapter)
+        return self.details_session
+
     def rotate_user_agent(self):
         """Rotate User-Agent intelligently"""
         self.current_ua_index = (self.current_ua_index + 1) % len(self.user_agents)
@@ -106,16 +129,24 @@ class OptimizedDownloader:
         delay = self.current_delay + random.uniform(-0.2, 0.5)
         delay = max(self.min_delay, delay)
 
-        # Respect delay since last request
-        elapsed = time.time() - self.last_request_time
+        # Respect delay since last request (monotonic: immune to wall-clock adjustments)
+        elapsed = time.monotonic() - self.last_request_time
         if elapsed < delay:
             sleep_time = delay - elapsed
             logging.debug(
                 "  Adaptive delay: %.2fs (failures: %d)", sleep_time, self.consecutive_failures
             )
-            time.sleep(sleep_time)
+            self.cancelled.wait(sleep_time)
 
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
+
+    def retry_backoff(self, attempt: int):
+        """Sleep before a retry: exponential backoff with jitter, capped at 15s"""
+        retry_delay = min(
+            self.base_delay * (2 ** (attempt + 1)) + random.uniform(0, self.min_delay), 15.0
+        )
+        logging.debug("  Retry backoff: %.2fs (attempt %d)", retry_delay, attempt + 1)
+        self.cancelled.wait(retry_delay)
 
     def is_waf_blocked(self, response_text: str) -> bool:
         """Detect WAF blocking"""
@@ -135,7 +166,7 @@ class OptimizedDownloader:
         self.consecutive_failures += 1
         extra_delay = random.uniform(*extra_delay_range)
         logging.warning("  WAF block detected, backing off %.1fs...", extra_delay)
-        time.sleep(extra_delay)
+        self.cancelled.wait(extra_delay)
         if self.total_requests % 10 == 0:  # Rotate occasionally after blocks
             self.rotate_user_agent()
 
@@ -146,7 +177,7 @@ class OptimizedDownloader:
         max_retries: int = 3,
         timeout: Optional[int] = None,
     ) -> Optional[bytes]:
-        """Download using urllib (for series details) with intelligent retry and WAF handling"""
+        """Download series details (keep-alive session) with intelligent retry and WAF handling"""
         self.total_requests += 1
 
         # Adaptive timeouts based on history
@@ -162,37 +193,69 @@ class OptimizedDownloader:
         if self.total_requests % 25 == 0:
             self.rotate_user_agent()
 
+        # Attempt details are only formatted when debug logging is enabled
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
         for attempt in range(max_retries):
             self.adaptive_delay()
+            if self.cancelled.is_set():
+                logging.debug("  Download cancelled: %s", url)
+                return None
 
             current_timeout = timeout + (attempt * 2)  # Increase timeout on each retry
             current_ua = self.user_agents[self.current_ua_index]
 
-            # Build display URL with parameters
-            if data:
-                display_url = f'{url}?{data.decode("utf-8") if isinstance(data, bytes) else data}'
-            else:
-                display_url = url
-
-            logging.debug(
-                "  Attempt %d/%d: %s (timeout: %ds)",
-                attempt + 1,
-                max_retries,
-                display_url[:100] + "..." if len(display_url) > 100 else display_url,
-                current_timeout,
-            )
+            if debug_enabled:
+                # Build display URL with parameters
+                if data:
+                    display_url = (
+                        f'{url}?{data.decode("utf-8") if isinstance(data, bytes) else data}'
+                    )
+                else:
+                    display_url = url
+
+                logging.debug(
+                    "  Attempt %d/%d: %s (timeout: %ds)",
+                    attempt + 1,
+                    max_retries,
+                    display_url[:100] + "..." if len(display_url) > 100 else display_url,
+                    current_timeout,
+                )
 
             try:
-                # Use urllib exactly like the original working version
-                url_request = urllib.request.Request(
-                    url, data=data, headers={"User-Agent": current_ua}
+                # Keep the request exactly like the original working urllib version (same
+                # headers, proxies and redirects), only over a reused connection
+                headers = {"User-Agent": current_ua}
+                if data is not None:
+                    headers["Content-Type"] = "application/x-www-form-urlencoded"
+                response = self.get_details_session().request(
+                    "POST" if data is not None else "GET",
+                    url,
+                    data=data,
+                    headers=headers,
+                    timeout=current_timeout,
                 )
-                json_content = urllib.request.urlopen(url_request, timeout=current_timeout).read()
 
-                if json_content and len(json_content) > 10:
+                if response.status_code == 403:
+                    self.handle_waf_block()
+                    continue
+
+                if response.status_code >= 400:
+                    logging.warning(
+                        "  HTTP Error %d on attempt %d: %s",
+                        response.status_code,
+                        attempt + 1,
+                        response.reason,
+                    )
+                    if response.status_code in [404, 410]:
+                        break  # Don't retry for permanent errors
+                    self.consecutive_failures += 1
+
+                elif len(response.content) > 10:
+                    json_content = response.content
                     # Check that it's valid JSON
                     try:
-                        json.loads(json_content)
+                        json_loads(json_content)
                         self.consecutive_failures = max(0, self.consecutive_failures - 1)
                         logging.debug("  Success: %d bytes received", len(json_content))
                         return json_content
@@ -203,21 +266,12 @@ class OptimizedDownloader:
                     logging.warning(
                         "  Empty/small response on attempt %d: %d bytes",
                         attempt + 1,
-                        len(json_content) if json_content else 0,
+                        len(response.content),
                     )
                     self.consecutive_failures += 1
 
-            except urllib.error.HTTPError as e:
-                if e.code == 403:
-                    self.handle_waf_block()
-                    continue
-                logging.warning("  HTTP Error %d on attempt %d: %s", e.code, attempt + 1, e.reason)
-                if e.code in [404, 410]:
-                    break  # Don't retry for permanent errors
-                self.consecutive_failures += 1
-
-            except urllib.error.URLError as e:
-                logging.warning("  URL Error on attempt %d: %s", attempt + 1, str(e.reason))
+            except requests.exceptions.RequestException as e:
+                logging.warning("  URL Error on attempt %d: %s", attempt + 1, str(e))
                 self.consecutive_failures += 1
 
             except Exception as e:
@@ -226,8 +280,7 @@ class OptimizedDownloader:
 
             # Wait before retry
             if attempt < max_retries - 1:
-                retry_delay = random.uniform(1, 3)
-                time.sleep(retry_delay)
+                self.retry_backoff(attempt)
 
         # All retries failed
         logging.warning("  All %d attempts failed", max_retries)
@@ -257,24 +310,31 @@ class OptimizedDownloader:
         if self.total_requests % 25 == 0:
             self.rotate_user_agent()
 
+        # Attempt details are only formatted when debug logging is enabled
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
         for attempt in range(max_retries):
             self.adaptive_delay()
+            if self.cancelled.is_set():
+                logging.debug("  Download cancelled: %s", url)
+                return None
 
             current_timeout = timeout + (attempt * 2)  # Increase timeout on each retry
 
-            # Build display URL with parameters for POST
-            if method.upper() == "POST" and data:
-                display_url = f"{url}?{data}"
-            else:
-                display_url = url
-
-            logging.debug(
-                "  Attempt %d/%d: %s (timeout: %ds)",
-                attempt + 1,
-                max_retries,
-                display_url[:100] + "..." if len(display_url) > 100 else display_url,
-                current_timeout,
-            )
+            if debug_enabled:
+                # Build display URL with parameters for POST
+                if method.upper() == "POST" and data:
+                    display_url = f"{url}?{data}"
+                else:
+                    display_url = url
+
+                logging.debug(
+                    "  Attempt %d/%d: %s (timeout: %ds)",
+                    attempt + 1,
+                    max_retries,
+                    display_url[:100] + "..." if len(display_url) > 100 else display_url,
+                    current_timeout,
+                )
 
             try:
                 if method.upper() == "POST":
@@ -321,18 +381,24 @@ class OptimizedDownloader:
 
             # Wait before retry
             if attempt < max_retries - 1:
-                retry_delay = random.uniform(1, 3)
-                time.sleep(retry_delay)
+                self.retry_backoff(attempt)
 
         # All retries failed
         logging.warning("  All %d attempts failed", max_retries)
         return None
 
+    def cancel(self):
+        """Cancel pending delays and retries (interrupted run): downloads give up early"""
+        self.cancelled.set()
+
     def close(self):
         """Clean shutdown"""
         if self.session:
             self.session.close()
             self.session = None
+        if self.details_session:
+            self.details_session.close()
+            self.details_session = None
 
     def get_stats(self) -> Dict[str, Any]:
         """Get download statistics"""
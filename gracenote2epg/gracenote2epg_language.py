@@ -66,7 +66,7 @@ class LanguageCache:
 
                             # Extract program ID
                             program_id = None
-                            for episode_num in programme.findall("episode-num"):
+                            for episode_num in programme.iterfind("episode-num"):
                                 if episode_num.get("system") == "dd_progid":
                                     program_id = episode_num.text
                                     if program_id and "." in program_id:
@@ -115,10 +115,10 @@ class LanguageCache:
             program_count = 0
             language_stats = {"fr": 0, "en": 0, "es": 0, "other": 0}
 
-            for programme in root.findall("programme"):
+            for programme in root.iterfind("programme"):
                 # Extract program ID from episode-num dd_progid
                 program_id = None
-                for episode_num in programme.findall("episode-num"):
+                for episode_num in programme.iterfind("episode-num"):
                     if episode_num.get("system") == "dd_progid":
                         program_id = episode_num.text
                         if program_id and "." in program_id:
@@ -12,16 +12,23 @@ import logging
 import re
 import time
 import urllib.parse
-from typing import Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
 
 from .gracenote2epg_downloader import OptimizedDownloader
 from .gracenote2epg_tvheadend import TvheadendClient
-from .gracenote2epg_utils import CacheManager, TimeUtils
+from .gracenote2epg_utils import CacheManager, TimeUtils, json_loads
 
 
 class GuideParser:
     """Parses TV guide data and manages extended details"""
 
+    GRID_API_URL = "http://tvlistings.gracenote.com/api/grid"
+
+    # Longest wait for an in-flight look-ahead request on shutdown (its last attempt
+    # uses an 8s timeout plus 2s per retry)
+    LOOKAHEAD_SHUTDOWN_TIMEOUT = 15
+
     def __init__(
         self,
         cache_manager: CacheManager,
@@ -32,6 +39,8 @@ class GuideParser:
         self.downloader = downloader
         self.tvh_client = tvh_client
         self.schedule: Dict = {}
+        # (query before time, query after time) for the current download
+        self._static_query: Optional[Tuple[str, str]] = None
 
     def optimized_guide_download(
         self, grid_time_start: float, day_hours: int, config_manager, refresh_hours: int = 48
@@ -61,57 +70,74 @@ class GuideParser:
         logging.info("  Refresh window: first %d hours will be re-downloaded", refresh_hours)
         logging.info("  Guide duration: %d blocks (%d hours)", day_hours, day_hours * 3)
 
-        downloaded_count = 0
-        cached_count = 0
-        failed_count = 0
-
-        count = 0
-        grid_time = grid_time_start
-
-        while count < day_hours:
-            # Generate standardized filename
-            standard_block_time = TimeUtils.get_standard_block_time(grid_time)
-            filename = standard_block_time.strftime("%Y%m%d%H") + ".json.gz"
-
-            # Build download URL with simplified configuration
-            url = self._build_gracenote_url(lineup_config, grid_time)
-
-            # Download block safely
-            if self.cache_manager.download_guide_block_safe(
-                self.downloader, grid_time, filename, url, refresh_hours
-            ):
-                # Determine if it was downloaded or cached
-                time_from_now = grid_time - time.time()
-                if 0 < time_from_now < (refresh_hours * 3600):
-                    # In refresh window - likely downloaded
-                    downloaded_count += 1
-                else:
-                    # Outside refresh window - likely cached
-                    cached_count += 1
-            else:
-                failed_count += 1
-
-            # Parse the file (cached or new)
-            content = self.cache_manager.load_guide_block(filename)
-            if content:
-                try:
-                    logging.debug("Parsing %s", filename)
-
-                    if count == 0:
-                        self.parse_stations(content)
-                    self.parse_episodes(content)
-
-                except Exception as e:
-                    logging.warning("Parse error for %s: %s", filename, str(e))
-
-            count += 1
-            grid_time = grid_time + 10800  # Next 3-hour block
+        # Resolve the lineup-dependent part of the grid URL once for all blocks
+        self._prepare_static_query(lineup_config)
+
+        # Refresh window boundaries, captured once for the whole run
+        now = time.time()
+        refresh_cutoff = now + refresh_hours * 3600
+
+        # Downloads stay strictly sequential (rate limiting and WAF protection rely on it),
+        # but the next block is fetched by a single worker thread while the current
+        # block is parsed, overlapping network waits with parsing
+        succeeded_times = []  # Grid times of blocks available (downloaded or cached)
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending = None
+        try:
+            if day_hours > 0:
+                pending = self._schedule_guide_block(
+                    executor, grid_time_start, refresh_hours, refresh_cutoff
+                )
+
+            for count in range(day_hours):
+                grid_time = grid_time_start + count * 10800  # 3-hour blocks
+                filename, success = pending.result()
+
+                # Start downloading the next block before parsing this one
+                if count + 1 < day_hours:
+                    pending = self._schedule_guide_block(
+                        executor, grid_time + 10800, refresh_hours, refresh_cutoff
+                    )
+
+                if success:
+                    succeeded_times.append(grid_time)
+
+                # Parse the file (cached or new)
+                content = self.cache_manager.load_guide_block(filename)
+                if content:
+                    try:
+                        logging.debug("Parsing %s", filename)
+
+                        if count == 0:
+                            self.parse_stations(content)
+                        self.parse_episodes(content)
+
+                    except Exception as e:
+                        logging.warning("Parse error for %s: %s", filename, str(e))
+        except BaseException:
+            # Interrupted (Ctrl+C) or failed: the look-ahead download skips its remaining
+            # delays and retries instead of keeping the run alive
+            self.downloader.cancel()
+            raise
+        finally:
+            # Drop a look-ahead block that has not started; give one in flight time to end
+            # its current request so the caller never closes the sessions under it
+            if pending is not None and not pending.cancel():
+                wait([pending], timeout=self.LOOKAHEAD_SHUTDOWN_TIMEOUT)
+            executor.shutdown(wait=False)
+
+        # Classify available blocks: in the refresh window - likely downloaded,
+        # outside of it - likely cached
+        downloaded_count = sum(
+            1 for grid_time in succeeded_times if now < grid_time < refresh_cutoff
+        )
+        cached_count = len(succeeded_times) - downloaded_count
+        failed_count = day_hours - len(succeeded_times)
 
         # Summary
         total_blocks = day_hours
-        success_rate = (
-            ((downloaded_count + cached_count) / total_blocks * 100) if total_blocks > 0 else 0
-        )
+        # max(1, total) keeps 0% for an empty guide without a separate branch
+        success_rate = 100.0 * (downloaded_count + cached_count) / max(1, total_blocks)
 
         logging.info("Guide download completed:")
         logging.info(
@@ -123,7 +149,7 @@ class GuideParser:
         )
         logging.info(
             "  Cache efficiency: %.1f%% reused",
-            (cached_count / total_blocks * 100) if total_blocks > 0 else 0,
+            100.0 * cached_count / max(1, total_blocks),
         )
         logging.info("  Success rate: %.1f%%", success_rate)
 
@@ -135,33 +161,62 @@ class GuideParser:
 
         return success_rate >= 80  # Consider successful if 80%+ blocks available
 
-    def _build_gracenote_url(self, lineup_config: Dict, grid_time: float) -> str:
-        """Build Gracenote URL with simplified lineup configuration"""
-
-        base_url = "http://tvlistings.gracenote.com/api/grid"
-
-        # Parameters in optimal order for maximum compatibility
-        params = [
-            ("aid", "orbebb"),
-            ("TMSID", ""),
-            ("AffiliateID", "lat"),
-            ("lineupId", lineup_config.get("lineup_id", "")),  # Normalized lineup ID
-            ("timespan", "3"),
-            ("headendId", lineup_config.get("headend_id", "lineupId")),  # Always 'lineupId'
-            ("country", lineup_config.get("country", "USA")),
-            ("device", lineup_config.get("device_type", "-")),  # Auto-detected device type
-            ("postalCode", lineup_config.get("postal_code", "")),
-            ("time", str(int(grid_time))),
-            ("isOverride", "true"),
-            ("pref", "-"),
-            ("userId", "-"),
-        ]
-
-        # Build URL
-        query_string = "&".join(
-            [f"{key}={urllib.parse.quote(str(value))}" for key, value in params]
+    def _schedule_guide_block(
+        self,
+        executor: ThreadPoolExecutor,
+        grid_time: float,
+        refresh_hours: int,
+        refresh_cutoff: float,
+    ) -> Future:
+        """Resolve cache hits right away, hand blocks that may need a download to the worker"""
+        # Generate standardized filename
+        filename = TimeUtils.get_block_filename(grid_time)
+
+        # Outside the refresh window (or with --norefresh) a cached block needs no network
+        in_refresh_window = refresh_hours != 0 and grid_time < refresh_cutoff
+        if not in_refresh_window and self.cache_manager.has_guide_block(filename):
+            logging.debug("Using cached: %s", filename)
+            cached = Future()
+            cached.set_result((filename, True))
+            return cached
+
+        return executor.submit(self._fetch_guide_block, grid_time, filename, refresh_hours)
+
+    def _fetch_guide_block(
+        self, grid_time: float, filename: str, refresh_hours: int
+    ) -> Tuple[str, bool]:
+        """Download (or reuse from cache) one guide block, returning (filename, success)"""
+        # Build download URL with simplified configuration
+        url = self._build_gracenote_url(grid_time)
+
+        # Download block safely
+        success = self.cache_manager.download_guide_block_safe(
+            self.downloader, grid_time, filename, url, refresh_hours
+        )
+        return filename, success
+
+    def _prepare_static_query(self, lineup_config: Dict):
+        """Build the quoted query string parts that do not change between guide blocks"""
+
+        def quoted(params):
+            return "&".join([f"{key}={urllib.parse.quote(str(value))}" for key, value in params])
+
+        # Parameters in optimal order for maximum compatibility (time goes in between)
+        before_time = quoted(
+            [
+                ("aid", "orbebb"),
+                ("TMSID", ""),
+                ("AffiliateID", "lat"),
+                ("lineupId", lineup_config.get("lineup_id", "")),  # Normalized lineup ID
+                ("timespan", "3"),
+                ("headendId", lineup_config.get("headend_id", "lineupId")),  # Always 'lineupId'
+                ("country", lineup_config.get("country", "USA")),
+                ("device", lineup_config.get("device_type", "-")),  # Auto-detected device type
+                ("postalCode", lineup_config.get("postal_code", "")),
+            ]
         )
-        full_url = f"{base_url}?{query_string}"
+        after_time = quoted([("isOverride", "true"), ("pref", "-"), ("userId", "-")])
+        self._static_query = (before_time, after_time)
 
         # Debug logging (without exposing full URL to avoid spam)
         if lineup_config.get("auto_detected"):
@@ -178,12 +233,17 @@ class GuideParser:
                 lineup_config.get("device_type", ""),
             )
 
-        return full_url
+    def _build_gracenote_url(self, grid_time: float) -> str:
+        """Build Gracenote URL for one block (requires _prepare_static_query first)"""
+        before_time, after_time = self._static_query
+
+        # Only the block time varies; an integer needs no quoting
+        return f"{self.GRID_API_URL}?{before_time}&time={int(grid_time)}&{after_time}"
 
     def parse_stations(self, content: bytes):
         """Parse station information from guide data"""
         try:
-            ch_guide = json.loads(content)
+            ch_guide = json_loads(content)
 
             for station in ch_guide.get("channels", []):
                 station_id = station.get("channelId")
@@ -226,7 +286,7 @@ class GuideParser:
         check_tba = "Safe"
 
         try:
-            ch_guide = json.loads(content)
+            ch_guide = json_loads(content)
 
             for station in ch_guide.get("channels", []):
                 station_id = station.get("channelId")
@@ -437,10 +497,10 @@ class GuideParser:
                             )
                             logging.debug("  URL: %s?%s", url, data)
 
-                            # Encode data for urllib
+                            # Encode form data for the POST body
                             data_encoded = data.encode("utf-8")
 
-                            # Download using urllib method
+                            # Download over the persistent details connection
                             content = self.downloader.download_with_retry_urllib(
                                 url, data=data_encoded, timeout=6
                             )
@@ -448,7 +508,7 @@ class GuideParser:
                             if content:
                                 if self.cache_manager.save_series_details(series_id, content):
                                     try:
-                                        cached_details = json.loads(content)
+                                        cached_details = json_loads(content)
                                         logging.info(
                                             "  Successfully downloaded: %s.json (%d bytes)",
                                             series_id,
@@ -495,7 +555,7 @@ class GuideParser:
 
             # Calculate success rate and cache efficiency
             success_rate = (success_count / download_count * 100) if download_count > 0 else 100
-            cache_efficiency = (unique_cached / total_series * 100) if total_series > 0 else 0
+            cache_efficiency = 100.0 * unique_cached / max(1, total_series)
 
             logging.info("  Download success rate: %.1f%%", success_rate)
             logging.info(
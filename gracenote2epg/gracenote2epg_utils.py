@@ -15,6 +15,16 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Optional faster JSON parser (C, accepts bytes); errors subclass json.JSONDecodeError
+try:
+    from orjson import loads as json_loads
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    from json import loads as json_loads
+
+    ORJSON_AVAILABLE = False
+
 
 class TimeUtils:
     """Time and date utilities"""
@@ -28,6 +38,18 @@ class TimeUtils:
         standard_dt = dt.replace(hour=standard_hour, minute=0, second=0, microsecond=0)
         return standard_dt
 
+    @staticmethod
+    def get_block_filename(timestamp: float) -> str:
+        """Cache filename (YYYYMMDDHH.json.gz) of the standardized 3-hour block"""
+        # Same local block time as get_standard_block_time, without the datetime/strftime
+        tm = time.localtime(timestamp)
+        return "%04d%02d%02d%02d.json.gz" % (
+            tm.tm_year,
+            tm.tm_mon,
+            tm.tm_mday,
+            (tm.tm_hour // 3) * 3,
+        )
+
     @staticmethod
     def conv_time(timestamp: float) -> str:
         """Convert timestamp to XMLTV time format (local time like zap2epg)"""
@@ -63,6 +85,8 @@ class CacheManager:
 
     def __init__(self, cache_dir: Path):
         self.cache_dir = Path(cache_dir)
+        # Guide blocks saved during this run and not loaded yet (filename -> JSON bytes)
+        self._fresh_guide_blocks: Dict[str, bytes] = {}
         # Create cache directory with proper 755 permissions (rwxr-xr-x)
         try:
             self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o755)
@@ -244,13 +268,22 @@ class CacheManager:
             file_path = self.cache_dir / filename
             with gzip.open(file_path, "wb") as f:
                 f.write(data)
+            # Keep the bytes for the upcoming load: avoids reading back and decompressing
+            self._fresh_guide_blocks[filename] = data
             return True
         except Exception as e:
             logging.warning("Error saving guide block %s: %s", filename, str(e))
             return False
 
+    def has_guide_block(self, filename: str) -> bool:
+        """Check if a guide block is available (saved this run or in the cache directory)"""
+        return filename in self._fresh_guide_blocks or (self.cache_dir / filename).exists()
+
     def load_guide_block(self, filename: str) -> Optional[bytes]:
         """Load compressed guide block data"""
+        fresh = self._fresh_guide_blocks.pop(filename, None)
+        if fresh is not None:
+            return fresh
         try:
             file_path = self.cache_dir / filename
             if file_path.exists():
@@ -277,7 +310,7 @@ class CacheManager:
             file_path = self.cache_dir / f"{series_id}.json"
             if file_path.exists() and file_path.stat().st_size > 0:
                 with open(file_path, "rb") as f:
-                    return json.loads(f.read())
+                    return json_loads(f.read())
         except (json.JSONDecodeError, OSError) as e:
             logging.warning("Error loading series details %s: %s", series_id, str(e))
             # Remove corrupted file
@@ -293,7 +326,7 @@ class CacheManager:
         """Validate JSON content and save guide block"""
         try:
             # Validate JSON
-            json.loads(content)
+            json_loads(content)
 
             # Save compressed
             return self.save_guide_block(filename, content)
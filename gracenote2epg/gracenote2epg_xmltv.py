@@ -6,7 +6,6 @@ station information, and program details with multi-language support.
 DTD-compliant version with optimized language detection caching and enhanced metadata.
 """
 
-import codecs
 import logging
 import re
 import time
@@ -49,7 +48,9 @@ class XmltvGenerator:
             # Generate new XMLTV
             encoding = "utf-8"
 
-            with codecs.open(xmltv_file, "w+b", encoding=encoding) as f:
+            # Many small writes: use a 64 KiB buffer to batch them into fewer write() calls,
+            # and newline="\n" to keep output byte-identical on every platform
+            with open(xmltv_file, "w", encoding=encoding, buffering=65536, newline="\n") as f:
                 self._print_header(f, encoding)
                 self._print_stations(f, schedule)
                 self._print_episodes(f, schedule, config)
@@ -201,7 +201,7 @@ def log_command_line_processing(args):
 
 def main():
     """Main application entry point"""
-    python_start_time = time.time()
+    python_start_time = time.monotonic()
 
     try:
         # Parse command line arguments
@@ -218,8 +218,7 @@ def main():
         log_file = defaults["log_file"]
 
         # Ensure directories exist
-        arg_parser = ArgumentParser()
-        arg_parser.create_directories_with_proper_permissions()
+        arg_parser.create_directories_with_proper_permissions(defaults)
 
         # Load and validate configuration
         config_manager = ConfigManager(config_file)
@@ -381,7 +380,7 @@ def main():
                 )
 
             # Final statistics
-            time_run = round(time.time() - python_start_time, 2)
+            time_run = round(time.monotonic() - python_start_time, 2)
             logging.info("gracenote2epg completed in %s seconds", time_run)
             logging.info(
                 "%d Stations and %d Episodes written to xmltv.xml file",
@@ -58,15 +58,21 @@ setup(
         "translations": [
             "polib>=1.1.0",
         ],
+        # Faster JSON parsing of guide data
+        "orjson": [
+            "orjson>=3.6.0",
+        ],
         # All functionalities (recommended)
         "full": [
             "langdetect>=1.0.9",
             "polib>=1.1.0",
+            "orjson>=3.6.0",
         ],
         # Development
         "dev": [
             "langdetect>=1.0.9",
             "polib>=1.1.0",
+            "orjson>=3.6.0",
             "pytest>=6.0",
             "flake8>=3.8",
             "black>=21.0",